@@ -1,37 +1,58 @@
 #!/usr/bin/env python3
+import json
 import os
-from aws_cdk import App, Environment
+from pathlib import Path
 
-from ik_hxr_cms_backend.ik_hxr_cms_backend_stack import IkHxrCmsBackendStack
+ENVS_FILE = Path(__file__).with_name('envs.json')
 
-app = App()
 
-env_name = app.node.try_get_context('env') or 'dev'
+def configure_environment():
+    # Leave stack traces off synth-time warning/error annotations, the only
+    # place aws-cdk-lib reads CDK_DISABLE_STACK_TRACE (construct traces are
+    # already off unless CDK_DEBUG is set). Node copies the environment once,
+    # so this must run before aws_cdk starts the jsii kernel. Export
+    # CDK_DISABLE_STACK_TRACE= (empty) to keep the annotation traces.
+    os.environ.setdefault('CDK_DISABLE_STACK_TRACE', '1')
 
-environments = {
-    'dev': {
-        'stack_name': 'IkHxrCmsBackendStack-Dev',
-        'region': 'us-east-2'
-    },
-    'stage': {
-        'stack_name': 'IkHxrCmsBackendStack-Stage',
-        'region': 'us-east-2'
-    },
-    'prod': {
-        'stack_name': 'IkHxrCmsBackendStack-Prod',
-        'region': 'us-east-2'
-    }
-}
 
-env_config = environments[env_name]
+# aws_cdk and the stack are imported inside the functions below so that
+# importing this module does not start the jsii kernel.
+def create_app(**kwargs):
+    configure_environment()
 
+    from aws_cdk import App
 
-IkHxrCmsBackendStack(app, env_config['stack_name'],
-    env=Environment(
-        account=app.node.try_get_context('account'),
-        region=env_config['region']
-    ),
-    env_name=env_name
-)
+    # No tree.json or analytics metadata; both walk every construct at synth
+    # end. This also drops the AWS::CDK::Metadata resource from the deployed
+    # templates, so the first deploy after this change removes it.
+    return App(analytics_reporting=False, tree_metadata=False, **kwargs)
 
-app.synth()
+
+def build(app, env_name, account=None):
+    from aws_cdk import Environment
+
+    from ik_hxr_cms_backend.ik_hxr_cms_backend_stack import (
+        IkHxrCmsBackendStack,
+    )
+
+    # Environment table lives in envs.json; only the selected record is kept.
+    env_config = json.loads(ENVS_FILE.read_text())[env_name]
+
+    IkHxrCmsBackendStack(app, env_config['stack_name'],
+        env=Environment(
+            account=account,
+            region=env_config['region']
+        ),
+        env_name=env_name
+    )
+
+
+if __name__ == '__main__':
+    app = create_app()
+
+    ctx = app.node.try_get_context
+    env_name, account = ctx('env') or 'dev', ctx('account')
+
+    build(app, env_name, account)
+
+    app.synth()
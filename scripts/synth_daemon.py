@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Keep the jsii kernel warm across repeated synths during development.
+
+Start the server once, then ask it to synth as often as needed:
+
+    python scripts/synth_daemon.py serve
+    python scripts/synth_daemon.py synth --env dev
+    cdk diff --app cdk.out
+
+Every request reloads app.py and all ik_hxr_cms_backend modules, so code
+edits are picked up, while the Node jsii process started by the first
+import stays alive. Requires the project to be installed in editable mode,
+which pip install -r requirements-dev.txt does.
+"""
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = 'ik_hxr_cms_backend'
+
+# One socket per checkout, kept short enough for the AF_UNIX path limit.
+CHECKOUT_ID = hashlib.sha1(str(PROJECT_ROOT).encode()).hexdigest()[:12]
+DEFAULT_SOCKET = os.path.join(
+    tempfile.gettempdir(), f'ik-hxr-cms-synth-{CHECKOUT_ID}.sock'
+)
+
+
+def load_app_module():
+    for name in list(sys.modules):
+        if name == PACKAGE or name.startswith(f'{PACKAGE}.'):
+            del sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(
+        'app', PROJECT_ROOT / 'app.py'
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_context(env_name, account=None):
+    # Same precedence as the cdk CLI: cdk.json context overrides the cached
+    # lookups in cdk.context.json, and --context values override both.
+    context = {}
+    context_file = PROJECT_ROOT / 'cdk.context.json'
+    if context_file.exists():
+        context.update(json.loads(context_file.read_text()))
+    cdk_json = json.loads((PROJECT_ROOT / 'cdk.json').read_text())
+    context.update(cdk_json.get('context', {}))
+
+    context['env'] = env_name
+    if account is not None:
+        context['account'] = account
+    return context
+
+
+def create_app(app_module, env_name, account=None, outdir='cdk.out'):
+    return app_module.create_app(
+        outdir=str(PROJECT_ROOT / outdir),
+        context=load_context(env_name, account),
+    )
+
+
+def synth(env_name, account=None, outdir='cdk.out'):
+    app_module = load_app_module()
+    app = create_app(app_module, env_name, account, outdir)
+    app_module.build(app, env_name, account)
+    return app.synth().directory
+
+
+def is_serving(socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            return False
+    return True
+
+
+def serve(socket_path):
+    if is_serving(socket_path):
+        sys.exit(f'A synth daemon is already listening on {socket_path}')
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    # The jsii kernel copies the environment when it starts, so app.py's
+    # settings must be in place before the first aws_cdk import.
+    load_app_module().configure_environment()
+    import aws_cdk  # noqa: F401  -- boot the jsii kernel up front
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(socket_path)
+        server.listen()
+        print(f'Listening on {socket_path}')
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile('r') as stream:
+                try:
+                    request = json.loads(stream.readline())
+                    reply = {'ok': True, 'outdir': synth(**request)}
+                except Exception as error:
+                    reply = {'ok': False, 'error': repr(error)}
+                try:
+                    conn.sendall(f'{json.dumps(reply)}\n'.encode())
+                except OSError:
+                    pass  # client went away before reading the reply
+
+
+def request_synth(socket_path, env_name, account, outdir):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        with client.makefile('rw') as stream:
+            stream.write(json.dumps({
+                'env_name': env_name,
+                'account': account,
+                'outdir': outdir,
+            }) + '\n')
+            stream.flush()
+            reply = json.loads(stream.readline())
+
+    if not reply['ok']:
+        sys.exit(reply['error'])
+    print(reply['outdir'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--socket', default=DEFAULT_SOCKET)
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('serve')
+    synth_parser = commands.add_parser('synth')
+    synth_parser.add_argument('--env', default='dev')
+    synth_parser.add_argument('--account')
+    synth_parser.add_argument('--outdir', default='cdk.out')
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        serve(args.socket)
+    else:
+        request_synth(args.socket, args.env, args.account, args.outdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import importlib.util
+import json
+import socket
+import threading
+import time
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "synth_daemon.py"
+
+
+def load_daemon():
+    spec = importlib.util.spec_from_file_location("synth_daemon", SCRIPT)
+    daemon = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(daemon)
+    return daemon
+
+
+def send(socket_path, line):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        with client.makefile("rw") as stream:
+            stream.write(line)
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def test_daemon_app_uses_cdk_json_context(tmp_path):
+    daemon = load_daemon()
+    app = daemon.create_app(
+        daemon.load_app_module(),
+        "stage",
+        account="123456789012",
+        outdir=str(tmp_path),
+    )
+
+    assert app.node.try_get_context("@aws-cdk/core:checkSecretUsage") is True
+    assert app.node.try_get_context("env") == "stage"
+    assert app.node.try_get_context("account") == "123456789012"
+
+
+def test_daemon_synth_writes_stack_template(tmp_path):
+    daemon = load_daemon()
+    outdir = daemon.synth("stage", outdir=str(tmp_path))
+
+    assert Path(outdir) == tmp_path
+    assert (tmp_path / "IkHxrCmsBackendStack-Stage.template.json").exists()
+
+
+def test_daemon_survives_malformed_request(tmp_path):
+    daemon = load_daemon()
+    socket_path = str(tmp_path / "synth.sock")
+    threading.Thread(
+        target=daemon.serve, args=(socket_path,), daemon=True
+    ).start()
+    for _ in range(300):
+        if daemon.is_serving(socket_path):
+            break
+        time.sleep(0.1)
+
+    reply = send(socket_path, "not json\n")
+    assert reply["ok"] is False
+
+    outdir = str(tmp_path / "out")
+    request = {"env_name": "dev", "account": None, "outdir": outdir}
+    reply = send(socket_path, json.dumps(request) + "\n")
+    assert reply == {"ok": True, "outdir": outdir}